@@ -30,6 +30,7 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Any, Dict, Generator, List, Optional
+from urllib.parse import quote_plus
 
 import litellm
 
@@ -445,8 +446,7 @@ def _calc_duration(start: str, end: str) -> int:
 
 def _gmaps_url(place: str, city: str) -> str:
     """Build a Google Maps search URL for a place in a city."""
-    query = f"{place} {city}".replace(" ", "+")
-    return f"https://www.google.com/maps/search/{query}"
+    return "https://www.google.com/maps/search/" + quote_plus(f"{place} {city}")
 
 
 def _fallback_day_plan(city: str, day_number: int) -> list[dict]:
@@ -991,22 +991,29 @@ def _detect_affected_days(
     return None
 
 
+_HEAVY_ITEM_FIELDS = frozenset(("travel_info", "delayed_to_day", "is_ai_suggested", "status"))
+
+
 def _strip_heavy_fields(itinerary: list[dict]) -> list[dict]:
-    """Return a lightweight deep copy of the itinerary for LLM prompts.
+    """Return a lightweight copy of the itinerary for LLM prompts.
 
     Strips travel_info (recomputed after modification), internal IDs,
     and status fields that add noise.  This can shrink the token count
     by 30-50 %.
+
+    Only the day and item dicts are rebuilt; nested values are shared with
+    the input, so the result must be treated as read-only.
     """
-    import copy
-    stripped = copy.deepcopy(itinerary)
-    for day in stripped:
-        for item in day.get("items", []):
-            item.pop("travel_info", None)
-            item.pop("delayed_to_day", None)
-            item.pop("is_ai_suggested", None)
-            item.pop("status", None)
-    return stripped
+    return [
+        {
+            **day,
+            "items": [
+                {k: v for k, v in item.items() if k not in _HEAVY_ITEM_FIELDS}
+                for item in day.get("items", [])
+            ],
+        }
+        for day in itinerary
+    ]
 
 
 # ---------------------------------------------------------------------------
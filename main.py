@@ -2,6 +2,7 @@
 import os
 import json
 import uuid
+import hashlib
 import shutil
 
 # Load .env before anything else
@@ -10,11 +11,11 @@ load_dotenv()
 
 import stripe
 
-from fastapi import FastAPI, HTTPException, Depends, Query, status
+from fastapi import FastAPI, HTTPException, Depends, Query, Header, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, Response
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import StreamingResponse, Response, JSONResponse
+from pydantic import BaseModel, model_validator
+from typing import List, Literal, Optional, Dict, Any
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
 from jose import JWTError, jwt
@@ -122,6 +123,18 @@ class CreateSplitRequest(BaseModel):
     payer_names: List[str]  # List of traveler names
     payer_emails: Optional[List[str]] = None
 
+
+class ItineraryMutation(BaseModel):
+    item_id: str
+    action: Literal["complete", "delay"]
+    new_day: Optional[int] = None  # required for 'delay'
+
+    @model_validator(mode="after")
+    def _delay_needs_new_day(self):
+        if self.action == "delay" and self.new_day is None:
+            raise ValueError("new_day is required when action is 'delay'")
+        return self
+
 # Helper functions
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -391,10 +404,10 @@ def credits_success(session_id: str = "", user_id: str = ""):
 
 # Trip endpoints
 @app.get("/trips")
-def get_trips(user_id: str):
+def get_trips(user_id: str, if_none_match: Optional[str] = Header(None)):
     db = get_db()
     trips = db.query(Trip).filter(Trip.user_id == user_id).all()
-    return [
+    body = [
         {
             "id": t.id,
             "title": t.title,
@@ -406,6 +419,12 @@ def get_trips(user_id: str):
         }
         for t in trips
     ]
+    
+    # Let clients revalidate with If-None-Match and skip the body when unchanged
+    etag = '"' + hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest() + '"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return JSONResponse(body, headers={"ETag": etag})
 
 @app.post("/trips")
 def create_trip(trip: TripCreate, user_id: str):
@@ -434,18 +453,14 @@ def create_trip(trip: TripCreate, user_id: str):
         "id": db_trip.id,
         "title": db_trip.title,
         "destination": db_trip.destination,
+        "start_date": db_trip.start_date,
+        "end_date": db_trip.end_date,
         "planning_status": db_trip.planning_status,
         "message": "Trip created successfully. Start planning to generate itinerary."
     }
 
-@app.get("/trips/{trip_id}")
-def get_trip(trip_id: str, user_id: str):
-    db = get_db()
-    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
-    
-    if not trip:
-        raise HTTPException(status_code=404, detail="Trip not found")
-    
+def _trip_details(trip) -> dict:
+    """Serialise a Trip row for GET /trips/{trip_id} and the bundle."""
     return {
         "id": trip.id,
         "title": trip.title,
@@ -462,6 +477,16 @@ def get_trip(trip_id: str, user_id: str):
         "created_at": trip.created_at.isoformat()
     }
 
+@app.get("/trips/{trip_id}")
+def get_trip(trip_id: str, user_id: str):
+    db = get_db()
+    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
+    
+    if not trip:
+        raise HTTPException(status_code=404, detail="Trip not found")
+    
+    return _trip_details(trip)
+
 @app.delete("/trips/{trip_id}")
 def delete_trip(trip_id: str, user_id: str):
     db = get_db()
@@ -893,15 +918,9 @@ def chat_modify_itinerary(trip_id: str, body: ChatRequest, user_id: str):
 
 
 # Itinerary endpoints
-@app.get("/trips/{trip_id}/itinerary")
-def get_itinerary(trip_id: str, user_id: str):
-    db = get_db()
-    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
-    
-    if not trip:
-        raise HTTPException(status_code=404, detail="Trip not found")
-    
-    items = db.query(ItineraryItem).filter(ItineraryItem.trip_id == trip_id).all()
+def _itinerary_days(db, trip) -> dict:
+    """The trip's itinerary items grouped by day, sorted by start time."""
+    items = db.query(ItineraryItem).filter(ItineraryItem.trip_id == trip.id).all()
     
     # Group by day
     days = {}
@@ -933,7 +952,7 @@ def get_itinerary(trip_id: str, user_id: str):
         days[day_num].sort(key=lambda x: x["start_time"])
     
     return {
-        "trip_id": trip_id,
+        "trip_id": trip.id,
         "destination": trip.destination,
         "days": [
             {
@@ -944,6 +963,16 @@ def get_itinerary(trip_id: str, user_id: str):
         ]
     }
 
+@app.get("/trips/{trip_id}/itinerary")
+def get_itinerary(trip_id: str, user_id: str):
+    db = get_db()
+    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
+    
+    if not trip:
+        raise HTTPException(status_code=404, detail="Trip not found")
+    
+    return _itinerary_days(db, trip)
+
 @app.put("/trips/{trip_id}/itinerary/items/{item_id}/delay")
 def delay_item(trip_id: str, item_id: str, new_day: int, user_id: str):
     db = get_db()
@@ -986,6 +1015,37 @@ def complete_item(trip_id: str, item_id: str, user_id: str):
     
     return {"message": "Item marked as completed"}
 
+@app.post("/trips/{trip_id}/itinerary/batch")
+def apply_itinerary_mutations(trip_id: str, mutations: List[ItineraryMutation], user_id: str):
+    """Apply several complete/delay actions in one request and one commit."""
+    db = get_db()
+    
+    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
+    if not trip:
+        raise HTTPException(status_code=404, detail="Trip not found")
+    
+    item_ids = [m.item_id for m in mutations]
+    items = {
+        item.id: item
+        for item in db.query(ItineraryItem).filter(
+            ItineraryItem.trip_id == trip_id, ItineraryItem.id.in_(item_ids)
+        )
+    }
+    missing = [i for i in item_ids if i not in items]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Items not found: {', '.join(missing)}")
+    
+    for m in mutations:
+        item = items[m.item_id]
+        if m.action == "complete":
+            item.status = "completed"
+        else:
+            item.status = "delayed"
+            item.delayed_to_day = m.new_day
+    db.commit()
+    
+    return {"message": f"Applied {len(mutations)} changes", "updated": len(mutations)}
+
 
 @app.get("/trips/{trip_id}/ical")
 def get_trip_ical(trip_id: str, user_id: str):
@@ -1039,15 +1099,9 @@ def get_trip_ical(trip_id: str, user_id: str):
 
 
 # Flight endpoints
-@app.get("/trips/{trip_id}/flights")
-def get_flights(trip_id: str, user_id: str):
-    db = get_db()
-    
-    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
-    if not trip:
-        raise HTTPException(status_code=404, detail="Trip not found")
-    
-    flights = db.query(Flight).filter(Flight.trip_id == trip_id).all()
+def _trip_flights(db, trip) -> list:
+    """Serialised Flight rows for the trip."""
+    flights = db.query(Flight).filter(Flight.trip_id == trip.id).all()
     
     return [
         {
@@ -1068,6 +1122,16 @@ def get_flights(trip_id: str, user_id: str):
         for f in flights
     ]
 
+@app.get("/trips/{trip_id}/flights")
+def get_flights(trip_id: str, user_id: str):
+    db = get_db()
+    
+    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
+    if not trip:
+        raise HTTPException(status_code=404, detail="Trip not found")
+    
+    return _trip_flights(db, trip)
+
 @app.post("/trips/{trip_id}/flights/{flight_id}/book")
 def book_flight(trip_id: str, flight_id: str, user_id: str):
     db = get_db()
@@ -1142,15 +1206,9 @@ def select_flight(trip_id: str, flight_id: str, user_id: str):
 
 
 # Accommodation endpoints
-@app.get("/trips/{trip_id}/accommodations")
-def get_accommodations(trip_id: str, user_id: str):
-    db = get_db()
-    
-    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
-    if not trip:
-        raise HTTPException(status_code=404, detail="Trip not found")
-    
-    accs = db.query(Accommodation).filter(Accommodation.trip_id == trip_id).all()
+def _trip_accommodations(db, trip) -> list:
+    """Serialised Accommodation rows for the trip."""
+    accs = db.query(Accommodation).filter(Accommodation.trip_id == trip.id).all()
     
     return [
         {
@@ -1172,6 +1230,37 @@ def get_accommodations(trip_id: str, user_id: str):
         for a in accs
     ]
 
+@app.get("/trips/{trip_id}/accommodations")
+def get_accommodations(trip_id: str, user_id: str):
+    db = get_db()
+    
+    trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
+    if not trip:
+        raise HTTPException(status_code=404, detail="Trip not found")
+    
+    return _trip_accommodations(db, trip)
+
+@app.get("/trips/{trip_id}/bundle")
+def get_trip_bundle(trip_id: str, user_id: str):
+    """Trip, itinerary, flights and accommodations in one round trip.
+
+    Uses a single DB session and a single ownership lookup for all four.
+    """
+    db = get_db()
+    try:
+        trip = db.query(Trip).filter(Trip.id == trip_id, Trip.user_id == user_id).first()
+        if not trip:
+            raise HTTPException(status_code=404, detail="Trip not found")
+        
+        return {
+            "trip": _trip_details(trip),
+            "itinerary": _itinerary_days(db, trip),
+            "flights": _trip_flights(db, trip),
+            "accommodations": _trip_accommodations(db, trip),
+        }
+    finally:
+        db.close()
+
 @app.post("/trips/{trip_id}/accommodations/{acc_id}/book")
 def book_accommodation(trip_id: str, acc_id: str, user_id: str):
     db = get_db()
@@ -11,3 +11,23 @@ def send_local_test():
         print("Email sent successfully!")
     except Exception as e:
         print(f"Failed to send email: {e}")
+
+BATCH_LIMIT = 100  # Resend accepts at most 100 emails per /emails/batch call
+
+def send_local_test_many(payloads):
+    """Send payloads via /emails/batch, one POST per 100 emails instead of one each.
+
+    Returns the response of every batch, in order. If a batch fails, raises
+    RuntimeError naming its offset; the batches before it have already gone out.
+    """
+    responses = []
+    for offset in range(0, len(payloads), BATCH_LIMIT):
+        chunk = payloads[offset:offset + BATCH_LIMIT]
+        try:
+            responses.append(resend.Batch.send(chunk))
+        except Exception as e:
+            raise RuntimeError(
+                f"Batch at offset {offset} ({len(chunk)} emails) failed; "
+                f"{offset} emails were already sent"
+            ) from e
+    return responses
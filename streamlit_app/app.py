@@ -3,15 +3,25 @@ Streamlit Main App - Entry point with navigation
 """
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import io
+import html
+import gc
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
 from datetime import datetime, timedelta
 
-import folium
-from streamlit_folium import st_folium
-from geopy.geocoders import Nominatim
-from icalendar import Calendar, Event as ICalEvent
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional speed-up; stdlib json reads bytes too
+    _loads = json.loads
 
 # Configure page
 st.set_page_config(
@@ -24,6 +34,44 @@ st.set_page_config(
 # API URL
 API_URL = "http://localhost:8000"
 
+# Seconds a cached GET (or a prefetched trip bundle) may be served
+API_CACHE_TTL = 30
+# Completed trips whose bundles the dashboard prefetches
+PREFETCH_LIMIT = 4
+
+
+class EP:
+    """API endpoint templates, relative to API_URL; fill in with .format()."""
+    LOGIN = "/auth/login"
+    REGISTER = "/auth/register"
+    TRIPS = "/trips"
+    TRIP = "/trips/{trip_id}"
+    ITINERARY = TRIP + "/itinerary"
+    ITINERARY_BATCH = ITINERARY + "/batch"
+    PLAN = TRIP + "/plan"
+    PLAN_STREAM = PLAN + "/stream"
+    FLIGHTS = TRIP + "/flights"
+    BOOK_FLIGHT = FLIGHTS + "/{flight_id}/book"
+    ACCOMMODATIONS = TRIP + "/accommodations"
+    BOOK_ACCOMMODATION = ACCOMMODATIONS + "/{acc_id}/book"
+    BUNDLE = TRIP + "/bundle"
+
+
+@st.cache_resource
+def _freeze_import_heap():
+    """Move everything allocated by imports out of the GC's reach, once per process.
+
+    Streamlit, requests and friends leave a large long-lived heap behind; frozen,
+    it is no longer rescanned by every full collection during reruns.
+    """
+    gc.freeze()
+
+
+_freeze_import_heap()
+
+# Partial reruns need Streamlit 1.33+ (experimental) / 1.37+; otherwise run inline
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", lambda f: f)
+
 # Initialize session state
 if "user" not in st.session_state:
     st.session_state.user = None
@@ -33,34 +81,279 @@ if "current_page" not in st.session_state:
     st.session_state.current_page = "login"
 
 
+# ── Helpers: API ────────────────────────────────────────────────────────────
+
+def _json(response):
+    """Parse a response body straight from bytes (orjson when installed)."""
+    return _loads(response.content)
+
+
+class _TimeoutSession(requests.Session):
+    """requests.Session with a default (connect, read) timeout for every call."""
+
+    def request(self, *args, timeout=(3, 30), **kwargs):
+        return super().request(*args, timeout=timeout, **kwargs)
+
+
+@st.cache_resource(max_entries=100)
+def api_session(token=None, user_id=None, retries=True) -> requests.Session:
+    """HTTP session per signed-in user, reusing keep-alive connections across reruns.
+
+    The bearer token and the user_id query parameter the API expects are set
+    once on the session instead of being passed to every call. Pass
+    retries=False for GETs with side effects, such as the plan stream.
+    """
+    session = _TimeoutSession()
+    if retries:
+        # Retry GETs (not POST) on connection errors and gateway hiccups; once
+        # retries run out, hand back the 5xx response rather than raising
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                      raise_on_status=False)
+    else:
+        retry = 0
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    if user_id is not None:
+        session.params = {"user_id": user_id}
+    return session
+
+
+def user_session(retries=True) -> requests.Session:
+    """api_session() for the user signed in to this browser session."""
+    return api_session(st.session_state.token, st.session_state.user["id"], retries)
+
+
+@st.cache_resource
+def api_executor() -> ThreadPoolExecutor:
+    """Shared worker threads for concurrent and background API calls."""
+    return ThreadPoolExecutor(max_workers=8)
+
+
+@st.cache_resource
+def etag_store() -> dict:
+    """(token, user_id, path) -> (ETag, parsed body) for conditional GETs."""
+    return {}
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def api_get(*paths, user_id, token=None):
+    """GET one or more API paths concurrently, cached briefly across reruns.
+
+    Returns the parsed JSON body for each path, in order. Any other reply
+    than 200 (or 304 for a known ETag) raises requests.HTTPError, which
+    st.cache_data does not cache, so a retry after a failure refetches.
+    Call api_get.clear() after any mutation; note that it drops the cached
+    entries of every user, not just the current one. Endpoints that send an
+    ETag are revalidated with If-None-Match, so an unchanged resource comes
+    back as an empty 304 once the cache entry expires.
+    """
+    session = api_session(token, user_id)
+    etags = etag_store()
+
+    def fetch(path):
+        key = (token, user_id, path)
+        cached = etags.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = session.get(f"{API_URL}{path}", headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code != 200:
+            raise requests.HTTPError(f"{response.status_code} for GET {path}", response=response)
+        body = _json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            if len(etags) >= 1000:
+                etags.clear()
+            etags[key] = (etag, body)
+        return body
+
+    if len(paths) == 1:
+        return [fetch(paths[0])]
+    return list(api_executor().map(fetch, paths))
+
+
+def prefetch_trip_bundles(trips, limit=PREFETCH_LIMIT):
+    """Start fetching the first few completed trips' bundles while the dashboard is shown."""
+    prefetch = st.session_state.setdefault("prefetch", {})
+    now = time.monotonic()
+    # Drop prefetches older than the api_get TTL so they can't serve stale data
+    for trip_id in [t for t, (started, _) in prefetch.items() if now - started > API_CACHE_TTL]:
+        del prefetch[trip_id]
+
+    session = user_session()
+    completed = [t for t in trips if t["planning_status"] == "completed"][:limit]
+    for trip in completed:
+        if trip["id"] not in prefetch:
+            prefetch[trip["id"]] = (now, api_executor().submit(
+                session.get, API_URL + EP.BUNDLE.format(trip_id=trip["id"]), timeout=10
+            ))
+
+
+def take_prefetched_bundle(trip_id):
+    """Return a fresh prefetched bundle for trip_id (consuming it), or None."""
+    entry = st.session_state.get("prefetch", {}).pop(trip_id, None)
+    if entry is None:
+        return None
+    started, future = entry
+    if time.monotonic() - started > API_CACHE_TTL:
+        return None
+    try:
+        response = future.result(timeout=5)
+    except Exception:
+        return None
+    return _json(response) if response.status_code == 200 else None
+
+
+def trip_bundle(trip_id):
+    """Trip, itinerary, flights and accommodations for trip_id, or None on an API error.
+
+    One GET serves the itinerary, flights and accommodations pages, so moving
+    between them within the api_get TTL costs no further round trips.
+    """
+    bundle = take_prefetched_bundle(trip_id)
+    if bundle is None:
+        try:
+            bundle = api_get(
+                EP.BUNDLE.format(trip_id=trip_id),
+                user_id=st.session_state.user["id"],
+                token=st.session_state.token
+            )[0]
+        except requests.HTTPError:
+            return None
+    return bundle
+
+
 # ── Helpers: geocoding & iCal ───────────────────────────────────────────────
 
-@st.cache_data(ttl=3600, show_spinner=False)
+GEOCODE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "geocode_cache.db")
+# Seconds to skip locations whose lookup hit a network/service error
+GEOCODE_RETRY_AFTER = 300
+
+
+@st.cache_resource
+def geocode_store():
+    """SQLite geocode cache shared by all sessions and kept across restarts."""
+    conn = sqlite3.connect(GEOCODE_DB, check_same_thread=False)
+    conn.execute("CREATE TABLE IF NOT EXISTS geo (query TEXT PRIMARY KEY, lat REAL, lon REAL)")
+    conn.commit()
+    return conn, threading.Lock()
+
+
+@st.cache_resource
+def geocoder():
+    """Nominatim client shared by all sessions, throttled to its 1 request/s policy."""
+    from geopy.extra.rate_limiter import RateLimiter
+    from geopy.geocoders import Nominatim
+
+    geolocator = Nominatim(user_agent="agentic-trip-planner-v1")
+    # No retries: this runs inside a page render, and failures are backed off
+    # by geocode_batch instead of being waited out here
+    return RateLimiter(geolocator.geocode, min_delay_seconds=1.0, max_retries=0,
+                       swallow_exceptions=False)
+
+
+@st.cache_resource
+def geocode_failures() -> dict:
+    """GEOCODE_DB key -> time.monotonic() of its last failed lookup, for all sessions."""
+    return {}
+
+
+@st.cache_data(ttl=24 * 3600, max_entries=5000, show_spinner=False)
 def geocode_location(location: str, city: str):
-    """Geocode a location string. Returns (lat, lon) or None."""
-    try:
-        geolocator = Nominatim(user_agent="agentic-trip-planner-v1")
-        result = geolocator.geocode(f"{location}, {city}", timeout=5)
-        if result:
-            return (result.latitude, result.longitude)
+    """Geocode a location string. Returns (lat, lon) or None.
+
+    Answers (including misses) are persisted in GEOCODE_DB, so Nominatim is
+    only asked once per (location, city) even across restarts. Network and
+    service errors propagate to the caller, so they are neither persisted
+    nor cached by st.cache_data and the lookup is retried on a later run.
+    """
+    conn, lock = geocode_store()
+    key = f"{location}|{city}"
+    with lock:
+        row = conn.execute("SELECT lat, lon FROM geo WHERE query = ?", (key,)).fetchone()
+    if row:
+        return None if row[0] is None else (row[0], row[1])
+
+    coords = None
+    geocode = geocoder()
+    result = geocode(f"{location}, {city}", timeout=5)
+    if not result:
         # Fallback: try location alone
-        result = geolocator.geocode(location, timeout=5)
-        if result:
-            return (result.latitude, result.longitude)
-    except Exception:
-        pass
-    return None
+        result = geocode(location, timeout=5)
+    if result:
+        coords = (result.latitude, result.longitude)
+
+    with lock:
+        conn.execute(
+            "INSERT OR REPLACE INTO geo (query, lat, lon) VALUES (?, ?, ?)",
+            (key, *(coords or (None, None))),
+        )
+        conn.commit()
+    return coords
+
+
+def geocode_batch(locations, city: str) -> dict:
+    """Geocode several locations at once. Returns {location: (lat, lon)} for hits.
+
+    Answers already in GEOCODE_DB are read with a single query; only the
+    remaining locations go through geocode_location (and Nominatim). When a
+    lookup errors, that location and the rest of the batch are skipped for
+    GEOCODE_RETRY_AFTER seconds, so an outage costs one timeout per few
+    minutes rather than one per location on every rerun.
+    """
+    if not locations:
+        return {}
+    conn, lock = geocode_store()
+    by_key = {f"{loc}|{city}": loc for loc in locations}
+    placeholders = ",".join("?" * len(by_key))
+    with lock:
+        rows = conn.execute(
+            f"SELECT query, lat, lon FROM geo WHERE query IN ({placeholders})", list(by_key)
+        ).fetchall()
+    resolved = {by_key[q]: (None if lat is None else (lat, lon)) for q, lat, lon in rows}
+
+    failures = geocode_failures()
+    now = time.monotonic()
+    pending = [
+        (key, loc) for key, loc in by_key.items()
+        if loc not in resolved and now - failures.get(key, now - GEOCODE_RETRY_AFTER) >= GEOCODE_RETRY_AFTER
+    ]
+    for i, (key, loc) in enumerate(pending):
+        try:
+            resolved[loc] = geocode_location(loc, city)
+        except Exception:
+            # Nominatim/network error: back off this and the remaining lookups
+            if len(failures) >= 5000:
+                failures.clear()
+            failures.update((k, now) for k, _ in pending[i:])
+            break
+        failures.pop(key, None)
+    return {loc: coords for loc, coords in resolved.items() if coords}
 
 
 def generate_ical(trip_info: dict, days: list) -> bytes:
-    """Generate an iCal (.ics) file from trip itinerary data."""
+    """Generate an iCal (.ics) file from trip itinerary data.
+
+    Events are serialised one at a time into a buffer between the calendar
+    header and footer, so only one Event object is alive at once.
+    """
+    from icalendar import Calendar, Event as ICalEvent
+
     cal = Calendar()
     cal.add("prodid", "-//Agentic Trip Planner//EN")
     cal.add("version", "2.0")
     cal.add("calscale", "GREGORIAN")
     cal.add("x-wr-calname", trip_info.get("title", "Trip Itinerary"))
 
-    trip_start = datetime.strptime(trip_info["start_date"], "%Y-%m-%d")
+    # An empty calendar serialises to header + END line; events go in between
+    footer = b"END:VCALENDAR\r\n"
+    buf = io.BytesIO()
+    buf.write(cal.to_ical()[:-len(footer)])
+
+    trip_start = datetime.fromisoformat(trip_info["start_date"])
 
     for day in days:
         day_num = day["day_number"]
@@ -84,12 +377,18 @@ def generate_ical(trip_info: dict, days: list) -> bytes:
                 ev.add("location", item["location"])
 
             ev.add("uid", f"{item.get('id', 'item')}@agentic-trip-planner")
-            cal.add_component(ev)
+            buf.write(ev.to_ical())
 
-    return cal.to_ical()
+    buf.write(footer)
+    return buf.getvalue()
 
 
-# Sidebar navigation
+# Sidebar navigation: (button label, page name in PAGES)
+NAV = [
+    ("🏠 Dashboard", "dashboard"),
+    ("➕ New Trip", "create_trip"),
+]
+
 def sidebar():
     with st.sidebar:
         st.title("✈️ Trip Planner")
@@ -98,19 +397,17 @@ def sidebar():
             st.write(f"Welcome, **{st.session_state.user['name']}**!")
             st.divider()
             
-            if st.button("🏠 Dashboard", use_container_width=True):
-                st.session_state.current_page = "dashboard"
-                st.rerun()
-            
-            if st.button("➕ New Trip", use_container_width=True):
-                st.session_state.current_page = "create_trip"
-                st.rerun()
+            for label, page in NAV:
+                if st.button(label, use_container_width=True):
+                    st.session_state.current_page = page
+                    st.rerun()
             
             st.divider()
             
             if st.button("🚪 Logout", use_container_width=True):
                 st.session_state.user = None
                 st.session_state.token = None
+                st.session_state.pop("prefetch", None)
                 st.session_state.current_page = "login"
                 st.rerun()
         else:
@@ -119,23 +416,7 @@ def sidebar():
 # Page router
 def main():
     sidebar()
-    
-    if st.session_state.current_page == "login":
-        show_login()
-    elif st.session_state.current_page == "register":
-        show_register()
-    elif st.session_state.current_page == "dashboard":
-        show_dashboard()
-    elif st.session_state.current_page == "create_trip":
-        show_create_trip()
-    elif st.session_state.current_page == "planning":
-        show_planning()
-    elif st.session_state.current_page == "itinerary":
-        show_itinerary()
-    elif st.session_state.current_page == "flights":
-        show_flights()
-    elif st.session_state.current_page == "accommodations":
-        show_accommodations()
+    PAGES.get(st.session_state.current_page, show_login)()
 
 def show_login():
     st.title("Welcome to Agentic Trip Planner 🤖✈️")
@@ -157,13 +438,13 @@ def show_login():
                     st.error("Please fill in all fields")
                 else:
                     try:
-                        response = requests.post(
-                            f"{API_URL}/auth/login",
+                        response = api_session().post(
+                            API_URL + EP.LOGIN,
                             json={"email": email, "password": password}
                         )
                         
                         if response.status_code == 200:
-                            data = response.json()
+                            data = _json(response)
                             st.session_state.token = data["access_token"]
                             st.session_state.user = data["user"]
                             st.session_state.current_page = "dashboard"
@@ -171,7 +452,7 @@ def show_login():
                             st.rerun()
                         else:
                             try:
-                                detail = response.json().get("detail", "Invalid email or password")
+                                detail = _json(response).get("detail", "Invalid email or password")
                             except (ValueError, KeyError):
                                 detail = f"Login failed (HTTP {response.status_code})"
                             st.error(detail)
@@ -207,13 +488,13 @@ def show_register():
                     st.error("Please fill in all fields")
                 else:
                     try:
-                        response = requests.post(
-                            f"{API_URL}/auth/register",
+                        response = api_session().post(
+                            API_URL + EP.REGISTER,
                             json={"name": name, "email": email, "password": password}
                         )
                         
                         if response.status_code == 200:
-                            data = response.json()
+                            data = _json(response)
                             st.session_state.token = data["access_token"]
                             st.session_state.user = data["user"]
                             st.session_state.current_page = "dashboard"
@@ -221,7 +502,7 @@ def show_register():
                             st.rerun()
                         else:
                             try:
-                                detail = response.json().get("detail", "Registration failed")
+                                detail = _json(response).get("detail", "Registration failed")
                             except (ValueError, KeyError):
                                 detail = f"Registration failed (HTTP {response.status_code})"
                             st.error(detail)
@@ -235,6 +516,43 @@ def show_register():
             st.session_state.current_page = "login"
             st.rerun()
 
+def render_trip_card(trip):
+    """Render one trip card with View/Delete buttons on the dashboard."""
+    with st.container():
+        st.subheader(trip["title"])
+        st.write(f"📍 {trip['destination']}")
+        st.write(f"📅 {trip['start_date']} to {trip['end_date']}")
+
+        # Status badge
+        status = trip["planning_status"]
+        if status == "completed":
+            st.success("✅ Planning Complete")
+        elif status == "in_progress":
+            st.info("🔄 Planning...")
+        else:
+            st.warning("⏳ Pending")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("View", key=f"view_{trip['id']}", use_container_width=True):
+                st.session_state.current_trip_id = trip["id"]
+                st.session_state.current_page = "itinerary"
+                st.rerun()
+        with col2:
+            if st.button("Delete", key=f"del_{trip['id']}", use_container_width=True):
+                try:
+                    del_response = user_session().delete(
+                        API_URL + EP.TRIP.format(trip_id=trip["id"])
+                    )
+                    if del_response.status_code == 200:
+                        api_get.clear()
+                        st.success("Trip deleted!")
+                        st.rerun()
+                except Exception as e:
+                    st.error(f"Error: {e}")
+
+        st.divider()
+
 def show_dashboard():
     if not st.session_state.user:
         st.session_state.current_page = "login"
@@ -244,60 +562,28 @@ def show_dashboard():
     st.title("My Trips 🗺️")
     
     try:
-        response = requests.get(
-            f"{API_URL}/trips",
-            params={"user_id": st.session_state.user["id"]}
-        )
+        trips = api_get(
+            EP.TRIPS,
+            user_id=st.session_state.user["id"],
+            token=st.session_state.token
+        )[0]
         
-        if response.status_code == 200:
-            trips = response.json()
-            
-            if not trips:
-                st.info("No trips yet! Create your first trip to get started.")
-                if st.button("➕ Create Your First Trip", type="primary"):
-                    st.session_state.current_page = "create_trip"
-                    st.rerun()
-            else:
-                # Display trips in a grid
-                cols = st.columns(2)
-                for i, trip in enumerate(trips):
-                    with cols[i % 2]:
-                        with st.container():
-                            st.subheader(trip["title"])
-                            st.write(f"📍 {trip['destination']}")
-                            st.write(f"📅 {trip['start_date']} to {trip['end_date']}")
-                            
-                            # Status badge
-                            status = trip["planning_status"]
-                            if status == "completed":
-                                st.success("✅ Planning Complete")
-                            elif status == "in_progress":
-                                st.info("🔄 Planning...")
-                            else:
-                                st.warning("⏳ Pending")
-                            
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                if st.button("View", key=f"view_{trip['id']}", use_container_width=True):
-                                    st.session_state.current_trip_id = trip["id"]
-                                    st.session_state.current_page = "itinerary"
-                                    st.rerun()
-                            with col2:
-                                if st.button("Delete", key=f"del_{trip['id']}", use_container_width=True):
-                                    try:
-                                        del_response = requests.delete(
-                                            f"{API_URL}/trips/{trip['id']}",
-                                            params={"user_id": st.session_state.user["id"]}
-                                        )
-                                        if del_response.status_code == 200:
-                                            st.success("Trip deleted!")
-                                            st.rerun()
-                                    except Exception as e:
-                                        st.error(f"Error: {e}")
-                            
-                            st.divider()
+        if not trips:
+            st.info("No trips yet! Create your first trip to get started.")
+            if st.button("➕ Create Your First Trip", type="primary"):
+                st.session_state.current_page = "create_trip"
+                st.rerun()
         else:
-            st.error("Failed to load trips")
+            prefetch_trip_bundles(trips)
+            
+            # Display trips in a grid, one row of two cards at a time
+            for pair in zip_longest(*[iter(trips)] * 2):
+                for col, trip in zip(st.columns(2), pair):
+                    if trip is not None:
+                        with col:
+                            render_trip_card(trip)
+    except requests.HTTPError:
+        st.error("Failed to load trips")
     except Exception as e:
         st.error(f"Error: {str(e)}")
 
@@ -404,15 +690,16 @@ def show_create_trip():
                         "budget_level": budget
                     }
                     
-                    response = requests.post(
-                        f"{API_URL}/trips",
-                        params={"user_id": st.session_state.user["id"]},
+                    response = user_session().post(
+                        API_URL + EP.TRIPS,
                         json=trip_data
                     )
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = _json(response)
+                        api_get.clear()
                         st.session_state.current_trip_id = data["id"]
+                        st.session_state.current_trip = data
                         st.session_state.current_page = "planning"
                         st.success("Trip created! Starting AI planning...")
                         st.rerun()
@@ -421,6 +708,31 @@ def show_create_trip():
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
 
+# Agent pipeline visual: (icon, name, description)
+_AGENTS = (
+    ("🔍", "Destination Researcher", "Researching your destination with web search"),
+    ("🏙️", "City Selector", "Choosing optimal cities to visit"),
+    ("✈️", "Flight Finder", "Searching for the best flights"),
+    ("🏨", "Accommodation Finder", "Finding perfect places to stay"),
+    ("📅", "Itinerary Planner", "Building your day-by-day plan"),
+)
+
+# SSE agent name -> position in the pipeline (1-based)
+_AGENT_ORDER = {
+    "DestinationResearcher": 1,
+    "CitySelector": 2,
+    "FlightFinder": 3,
+    "AccommodationFinder": 4,
+    "ItineraryPlanner": 5,
+}
+
+# SSE agent name -> (progress % while running, progress % when done), capped at 95
+_AGENT_PCT = {
+    name: (min(int((idx - 1) / len(_AGENT_ORDER) * 100), 95),
+           min(int(idx / len(_AGENT_ORDER) * 100), 95))
+    for name, idx in _AGENT_ORDER.items()
+}
+
 def show_planning():
     if not st.session_state.user:
         st.session_state.current_page = "login"
@@ -434,23 +746,16 @@ def show_planning():
     
     st.title("🤖 AI Agents Planning Your Trip...")
     
-    # Agent pipeline visual
-    AGENTS = [
-        ("🔍", "Destination Researcher", "Researching your destination with web search"),
-        ("🏙️", "City Selector", "Choosing optimal cities to visit"),
-        ("✈️", "Flight Finder", "Searching for the best flights"),
-        ("🏨", "Accommodation Finder", "Finding perfect places to stay"),
-        ("📅", "Itinerary Planner", "Building your day-by-day plan"),
-    ]
-    
     try:
-        trip_response = requests.get(
-            f"{API_URL}/trips/{trip_id}",
-            params={"user_id": st.session_state.user["id"]}
-        )
+        # The trip just created is already in session state; only GET otherwise
+        trip = st.session_state.pop("current_trip", None)
+        if trip is None or trip.get("id") != trip_id:
+            trip_response = user_session().get(
+                API_URL + EP.TRIP.format(trip_id=trip_id)
+            )
+            trip = _json(trip_response) if trip_response.status_code == 200 else None
         
-        if trip_response.status_code == 200:
-            trip = trip_response.json()
+        if trip is not None:
             st.write(f"### {trip['title']}")
             st.write(f"📍 {trip['destination']} | 📅 {trip['start_date']} to {trip['end_date']}")
             st.divider()
@@ -481,7 +786,7 @@ def show_planning():
             
             # Create placeholder containers for each agent
             agent_containers = []
-            for icon, name, desc in AGENTS:
+            for icon, name, desc in _AGENTS:
                 c = st.container()
                 with c:
                     cols = st.columns([1, 8, 3])
@@ -503,9 +808,9 @@ def show_planning():
             status_text.info("🚀 Starting agent pipeline...")
             
             try:
-                response = requests.get(
-                    f"{API_URL}/trips/{trip_id}/plan/stream",
-                    params={"user_id": st.session_state.user["id"]},
+                # Opening the stream charges a credit and starts a run: never replay it
+                response = user_session(retries=False).get(
+                    API_URL + EP.PLAN_STREAM.format(trip_id=trip_id),
                     stream=True,
                     timeout=300,
                 )
@@ -513,12 +818,12 @@ def show_planning():
                 if response.status_code != 200:
                     # Fallback to sync endpoint
                     status_text.warning("Falling back to synchronous planning...")
-                    plan_response = requests.post(
-                        f"{API_URL}/trips/{trip_id}/plan",
-                        params={"user_id": st.session_state.user["id"]},
+                    plan_response = user_session().post(
+                        API_URL + EP.PLAN.format(trip_id=trip_id),
                         timeout=300,
                     )
                     if plan_response.status_code == 200:
+                        api_get.clear()
                         st.success("✅ Planning completed!")
                         st.session_state.current_page = "itinerary"
                         st.rerun()
@@ -526,70 +831,83 @@ def show_planning():
                         st.error("Planning failed.")
                     return
                 
-                # Process SSE events
-                agent_progress_map = {}  # node_name -> latest status
-                log_entries = []
+                # Process SSE events. Each network chunk can carry several
+                # events; apply them all, then push one update to the browser
+                # per chunk instead of one per event.
+                latest = {}  # "pct" / "status" -> most recent value in this chunk
+                log_lines = []
                 
-                for line in response.iter_lines(decode_unicode=True):
-                    if not line or not line.startswith("data: "):
-                        continue
-                    
-                    try:
-                        event = json.loads(line[6:])  # strip "data: "
-                    except json.JSONDecodeError:
-                        continue
-                    
-                    event_type = event.get("type", event.get("status", ""))
-                    
-                    if event_type == "error":
-                        st.error(f"❌ Error: {event.get('message', 'Unknown error')}")
-                        return
-                    
-                    if event_type == "complete":
-                        progress_bar.progress(100)
-                        status_text.success("✅ All agents finished! Trip plan ready.")
+                def flush():
+                    if "pct" in latest:
+                        progress_bar.progress(latest["pct"])
+                    if "status" in latest:
+                        kind, text = latest["status"]
+                        getattr(status_text, kind)(text)
+                    if log_lines:
                         with log_container:
-                            st.write(f"✅ **Orchestrator**: Trip planning complete!")
-                        time.sleep(1)
-                        st.balloons()
-                        st.session_state.current_page = "itinerary"
-                        st.rerun()
-                        return
-                    
-                    # Progress event
-                    agent_name = event.get("agent", "Unknown")
-                    agent_status = event.get("status", "")
-                    message = event.get("message", "")
-                    
-                    # Update progress bar based on agent
-                    agent_order = {
-                        "DestinationResearcher": 1,
-                        "CitySelector": 2,
-                        "FlightFinder": 3,
-                        "AccommodationFinder": 4,
-                        "ItineraryPlanner": 5,
-                    }
-                    agent_idx = agent_order.get(agent_name, 0)
-                    if agent_status == "running":
-                        pct = int((agent_idx - 1) / 5 * 100)
-                        progress_bar.progress(min(pct, 95))
-                        status_text.info(f"🔄 **{agent_name}**: {message}")
-                    elif agent_status == "done":
-                        pct = int(agent_idx / 5 * 100)
-                        progress_bar.progress(min(pct, 95))
-                        status_text.success(f"✅ **{agent_name}**: {message}")
-                    elif agent_status == "skipped":
-                        status_text.info(f"⏭️ **{agent_name}**: {message}")
-                    
-                    with log_container:
+                            st.markdown("  \n".join(log_lines))
+                    latest.clear()
+                    log_lines.clear()
+                
+                # Work on raw bytes: the JSON parser accepts them directly, so lines
+                # that aren't data events are skipped without being decoded
+                partial = b""
+                # uvicorn streams this chunked, and each chunk is yielded as it
+                # arrives; the fixed size keeps progress flowing (1 KiB at a
+                # time) even if a proxy strips the chunked encoding
+                for chunk in response.iter_content(chunk_size=1024):
+                    *lines, partial = (partial + chunk).split(b"\n")
+                    for line in lines:
+                        if not line.startswith(b"data: "):
+                            continue
+                        
+                        try:
+                            event = _loads(line[6:])  # strip "data: "
+                        except ValueError:
+                            continue
+                        
+                        event_type = event.get("type", event.get("status", ""))
+                        
+                        if event_type == "error":
+                            flush()
+                            st.error(f"❌ Error: {event.get('message', 'Unknown error')}")
+                            return
+                        
+                        if event_type == "complete":
+                            flush()
+                            progress_bar.progress(100)
+                            status_text.success("✅ All agents finished! Trip plan ready.")
+                            with log_container:
+                                st.write(f"✅ **Orchestrator**: Trip planning complete!")
+                            time.sleep(1)
+                            api_get.clear()
+                            st.balloons()
+                            st.session_state.current_page = "itinerary"
+                            st.rerun()
+                            return
+                        
+                        # Progress event
+                        agent_name = event.get("agent", "Unknown")
+                        agent_status = event.get("status", "")
+                        message = event.get("message", "")
+                        
+                        # Update progress bar based on agent
+                        running_pct, done_pct = _AGENT_PCT.get(agent_name, (0, 0))
                         if agent_status == "running":
-                            st.write(f"🔄 **{agent_name}**: {message}")
+                            latest["pct"] = running_pct
+                            latest["status"] = ("info", f"🔄 **{agent_name}**: {message}")
+                            log_lines.append(f"🔄 **{agent_name}**: {message}")
                         elif agent_status == "done":
-                            st.write(f"✅ **{agent_name}**: {message}")
+                            latest["pct"] = done_pct
+                            latest["status"] = ("success", f"✅ **{agent_name}**: {message}")
+                            log_lines.append(f"✅ **{agent_name}**: {message}")
                         elif agent_status == "skipped":
-                            st.write(f"⏭️ **{agent_name}**: {message}")
+                            latest["status"] = ("info", f"⏭️ **{agent_name}**: {message}")
+                            log_lines.append(f"⏭️ **{agent_name}**: {message}")
+                    flush()
                 
                 # If we got here without a complete event, check status
+                api_get.clear()
                 st.session_state.current_page = "itinerary"
                 st.rerun()
                 
@@ -600,6 +918,149 @@ def show_planning():
     except Exception as e:
         st.error(f"Error: {str(e)}")
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def day_map_html(trip_id, day_num, points_key, _points):
+    """Render the folium map for one itinerary day to standalone HTML.
+
+    Cached on (trip, day, points_key), so reruns that leave the day's
+    locations unchanged skip rebuilding the map. st.cache_data hands each
+    session its own copy of the string; no Map object is shared.
+    """
+    import folium
+
+    avg_lat = sum(p["lat"] for p in _points) / len(_points)
+    avg_lon = sum(p["lon"] for p in _points) / len(_points)
+
+    m = folium.Map(location=[avg_lat, avg_lon], zoom_start=13, tiles=None)
+    folium.TileLayer(
+        tiles="https://mt1.google.com/vt/lyrs=m&x={x}&y={y}&z={z}",
+        attr="Google",
+        name="Google Maps",
+    ).add_to(m)
+
+    for idx, pt in enumerate(_points, 1):
+        # Titles and locations come from the planner; escape them, since the
+        # page runs scripts in an iframe with access to the app
+        title = html.escape(str(pt["title"]))
+        folium.Marker(
+            location=[pt["lat"], pt["lon"]],
+            popup=folium.Popup(
+                f"<b>{idx}. {title}</b><br>"
+                f"🕐 {html.escape(str(pt['time']))}<br>"
+                f"📍 {html.escape(str(pt['location']))}",
+                max_width=250,
+            ),
+            tooltip=f"{idx}. {title}",
+            icon=folium.DivIcon(
+                html=(
+                    f'<div style="font-size:14px;color:#fff;'
+                    f'background:#e74c3c;border-radius:50%;'
+                    f'width:28px;height:28px;text-align:center;'
+                    f'line-height:28px;font-weight:bold;'
+                    f'border:2px solid #fff;'
+                    f'box-shadow:0 2px 6px rgba(0,0,0,.3);"'
+                    f'>{idx}</div>'
+                ),
+                icon_size=(28, 28),
+                icon_anchor=(14, 14),
+            ),
+        ).add_to(m)
+
+    # Dashed route line connecting activities in order
+    if len(_points) > 1:
+        folium.PolyLine(
+            locations=[(p["lat"], p["lon"]) for p in _points],
+            color="#3498db",
+            weight=3,
+            opacity=0.7,
+            dash_array="10",
+        ).add_to(m)
+
+    return m.get_root().render()
+
+@_fragment
+def render_itinerary_items(items, trip_id, num_days, selected_day_num):
+    """Render a day's items with Done/Delay controls and a single Apply button.
+
+    Runs as a fragment, so ticking boxes only reruns this block rather than
+    refetching the itinerary and redrawing the map.
+    """
+    # Done/Delay choices are queued and applied together
+    pending = []
+    for item in items:
+        with st.container():
+            col1, col2, col3 = st.columns([2, 6, 2])
+    
+            with col1:
+                st.write(f"**{item['start_time']}**")
+    
+            with col2:
+                title = item["title"]
+                if item.get("is_ai_suggested"):
+                    title += " ⭐"
+                st.write(f"**{title}**")
+                st.write(f"_{item['description']}_")
+    
+                if item.get("location"):
+                    maps_url = item.get("google_maps_url", "")
+                    if maps_url:
+                        st.markdown(f"📍 [{item['location']}]({maps_url})")
+                    else:
+                        st.write(f"📍 {item['location']}")
+    
+                # Show local currency + USD
+                cost_local = item.get("cost_local", "")
+                cost_usd = item.get("cost_usd", item.get("cost", 0))
+                currency = item.get("currency", "USD")
+                if cost_usd and float(cost_usd) > 0:
+                    if currency != "USD" and cost_local:
+                        st.write(f"💵 {cost_local} (~${cost_usd} USD)")
+                    else:
+                        st.write(f"💵 ${cost_usd}")
+    
+            with col3:
+                # Status
+                status = item["status"]
+                if status == "completed":
+                    st.success("✓ Done")
+                elif status == "delayed":
+                    st.warning("Delayed")
+                else:
+                    st.info("Planned")
+    
+                # Actions
+                if item["status"] == "planned":
+                    done = st.checkbox("✓ Done", key=f"done_{item['id']}")
+    
+                    # Delay option
+                    new_day = st.number_input(
+                        "Delay to day",
+                        min_value=1,
+                        max_value=num_days,
+                        value=selected_day_num,
+                        key=f"delay_{item['id']}"
+                    )
+                    if done:
+                        pending.append({"item_id": item["id"], "action": "complete"})
+                    elif new_day != selected_day_num:
+                        pending.append({"item_id": item["id"], "action": "delay", "new_day": new_day})
+    
+            st.divider()
+    
+    if st.button(f"Apply {len(pending)} change(s)", type="primary", disabled=not pending):
+        try:
+            batch_response = user_session().post(
+                API_URL + EP.ITINERARY_BATCH.format(trip_id=trip_id),
+                json=pending
+            )
+            if batch_response.status_code == 200:
+                api_get.clear()
+                st.rerun()
+            else:
+                st.error("Failed to apply changes")
+        except Exception as e:
+            st.error(f"Error: {e}")
+
 def show_itinerary():
     if not st.session_state.user:
         st.session_state.current_page = "login"
@@ -614,25 +1075,16 @@ def show_itinerary():
     st.title("📅 Your Itinerary")
     
     try:
-        # Get trip details
-        trip_response = requests.get(
-            f"{API_URL}/trips/{trip_id}",
-            params={"user_id": st.session_state.user["id"]}
-        )
+        # Trip details and itinerary come from the one bundle request
+        bundle = trip_bundle(trip_id)
+        trip = bundle["trip"] if bundle else None
+        data = bundle["itinerary"] if bundle else None
         
-        if trip_response.status_code == 200:
-            trip = trip_response.json()
+        if trip is not None:
             st.write(f"### {trip['title']}")
             st.write(f"📍 {trip['destination']}")
         
-        # Get itinerary
-        response = requests.get(
-            f"{API_URL}/trips/{trip_id}/itinerary",
-            params={"user_id": st.session_state.user["id"]}
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
+        if data is not None:
             days = data.get("days", [])
             
             if not days:
@@ -640,7 +1092,7 @@ def show_itinerary():
                 return
 
             # ── iCal download ────────────────────────────────────────
-            if trip_response.status_code == 200:
+            if trip is not None:
                 ical_bytes = generate_ical(trip, days)
                 safe_name = trip.get("title", "trip").replace(" ", "_")
                 st.download_button(
@@ -651,12 +1103,13 @@ def show_itinerary():
                 )
 
             # Day selector
-            day_options = [f"Day {d['day_number']}" for d in days]
-            selected_day = st.selectbox("Select Day", day_options)
-            selected_day_num = int(selected_day.split()[1])
+            days_by_num = {d["day_number"]: d for d in days}
+            selected_day_num = st.selectbox(
+                "Select Day", list(days_by_num), format_func=lambda n: f"Day {n}"
+            )
             
             # Find selected day data
-            day_data = next((d for d in days if d["day_number"] == selected_day_num), None)
+            day_data = days_by_num.get(selected_day_num)
             
             if day_data:
                 items = day_data["items"]
@@ -667,10 +1120,12 @@ def show_itinerary():
                 destination = data.get("destination", "")
                 map_points = []
                 with st.spinner("Mapping locations…"):
+                    locations = tuple(dict.fromkeys(itm["location"] for itm in items if itm.get("location")))
+                    coords_by_loc = geocode_batch(locations, destination)
                     for itm in items:
                         loc = itm.get("location")
                         if loc:
-                            coords = geocode_location(loc, destination)
+                            coords = coords_by_loc.get(loc)
                             if coords:
                                 map_points.append({
                                     "title": itm["title"],
@@ -681,136 +1136,71 @@ def show_itinerary():
                                 })
 
                 if map_points:
-                    avg_lat = sum(p["lat"] for p in map_points) / len(map_points)
-                    avg_lon = sum(p["lon"] for p in map_points) / len(map_points)
-
-                    m = folium.Map(location=[avg_lat, avg_lon], zoom_start=13, tiles=None)
-                    folium.TileLayer(
-                        tiles="https://mt1.google.com/vt/lyrs=m&x={x}&y={y}&z={z}",
-                        attr="Google",
-                        name="Google Maps",
-                    ).add_to(m)
-
-                    for idx, pt in enumerate(map_points, 1):
-                        folium.Marker(
-                            location=[pt["lat"], pt["lon"]],
-                            popup=folium.Popup(
-                                f"<b>{idx}. {pt['title']}</b><br>"
-                                f"🕐 {pt['time']}<br>"
-                                f"📍 {pt['location']}",
-                                max_width=250,
-                            ),
-                            tooltip=f"{idx}. {pt['title']}",
-                            icon=folium.DivIcon(
-                                html=(
-                                    f'<div style="font-size:14px;color:#fff;'
-                                    f'background:#e74c3c;border-radius:50%;'
-                                    f'width:28px;height:28px;text-align:center;'
-                                    f'line-height:28px;font-weight:bold;'
-                                    f'border:2px solid #fff;'
-                                    f'box-shadow:0 2px 6px rgba(0,0,0,.3);"'
-                                    f'>{idx}</div>'
-                                ),
-                                icon_size=(28, 28),
-                                icon_anchor=(14, 14),
-                            ),
-                        ).add_to(m)
-
-                    # Dashed route line connecting activities in order
-                    if len(map_points) > 1:
-                        folium.PolyLine(
-                            locations=[(p["lat"], p["lon"]) for p in map_points],
-                            color="#3498db",
-                            weight=3,
-                            opacity=0.7,
-                            dash_array="10",
-                        ).add_to(m)
-
-                    st_folium(m, height=420, use_container_width=True,
-                              key=f"map_day_{selected_day_num}")
+                    points_key = tuple(
+                        (p["lat"], p["lon"], p["title"], p["time"], p["location"])
+                        for p in map_points
+                    )
+                    map_html = day_map_html(trip_id, selected_day_num, points_key, map_points)
+                    # Newer Streamlit replaces components.html with st.iframe
+                    if hasattr(st, "iframe"):
+                        st.iframe(map_html, height=420)
+                    else:
+                        import streamlit.components.v1 as components
+                        components.html(map_html, height=420)
                 else:
                     st.info("📍 No locations could be mapped for this day.")
 
                 st.divider()
 
-                # Display items
-                for item in items:
-                    with st.container():
-                        col1, col2, col3 = st.columns([2, 6, 2])
-                        
-                        with col1:
-                            st.write(f"**{item['start_time']}**")
-                        
-                        with col2:
-                            title = item["title"]
-                            if item.get("is_ai_suggested"):
-                                title += " ⭐"
-                            st.write(f"**{title}**")
-                            st.write(f"_{item['description']}_")
-                            
-                            if item.get("location"):
-                                maps_url = item.get("google_maps_url", "")
-                                if maps_url:
-                                    st.markdown(f"📍 [{item['location']}]({maps_url})")
-                                else:
-                                    st.write(f"📍 {item['location']}")
-                            
-                            # Show local currency + USD
-                            cost_local = item.get("cost_local", "")
-                            cost_usd = item.get("cost_usd", item.get("cost", 0))
-                            currency = item.get("currency", "USD")
-                            if cost_usd and float(cost_usd) > 0:
-                                if currency != "USD" and cost_local:
-                                    st.write(f"💵 {cost_local} (~${cost_usd} USD)")
-                                else:
-                                    st.write(f"💵 ${cost_usd}")
-                        
-                        with col3:
-                            # Status
-                            status = item["status"]
-                            if status == "completed":
-                                st.success("✓ Done")
-                            elif status == "delayed":
-                                st.warning("Delayed")
-                            else:
-                                st.info("Planned")
-                            
-                            # Actions
-                            if item["status"] == "planned":
-                                if st.button("✓ Done", key=f"done_{item['id']}"):
-                                    try:
-                                        requests.put(
-                                            f"{API_URL}/trips/{trip_id}/itinerary/items/{item['id']}/complete",
-                                            params={"user_id": st.session_state.user["id"]}
-                                        )
-                                        st.rerun()
-                                    except:
-                                        pass
-                                
-                                # Delay option
-                                new_day = st.number_input(
-                                    "Delay to day",
-                                    min_value=1,
-                                    max_value=len(days),
-                                    value=selected_day_num,
-                                    key=f"delay_{item['id']}"
-                                )
-                                if st.button("Delay", key=f"delay_btn_{item['id']}"):
-                                    try:
-                                        requests.put(
-                                            f"{API_URL}/trips/{trip_id}/itinerary/items/{item['id']}/delay",
-                                            params={"user_id": st.session_state.user["id"], "new_day": new_day}
-                                        )
-                                        st.rerun()
-                                    except:
-                                        pass
-                        
-                        st.divider()
+                render_itinerary_items(items, trip_id, len(days), selected_day_num)
         else:
             st.error("Failed to load itinerary")
     except Exception as e:
         st.error(f"Error: {str(e)}")
 
+def render_flight_list(header, flights, trip_id, key_prefix):
+    """Render one section of flight cards with a Book button per flight."""
+    st.header(header)
+    for flight in flights:
+        with st.container():
+            col1, col2, col3 = st.columns([3, 5, 2])
+            
+            with col1:
+                st.markdown(f"**{flight['airline']}**  \n{flight['flight_number']}")
+            
+            with col2:
+                dep = flight["departure_datetime"][:16].replace("T", " ")
+                arr = flight["arrival_datetime"][:16].replace("T", " ")
+                hours, mins = divmod(flight["duration_minutes"], 60)
+                st.markdown(
+                    f"{flight['from_airport']} → {flight['to_airport']}  \n"
+                    f"🛫 {dep}  \n"
+                    f"🛬 {arr}  \n"
+                    f"⏱️ {hours}h {mins}m"
+                )
+            
+            with col3:
+                st.write(f"**${flight['price']}**")
+                
+                if flight["status"] == "booked":
+                    st.success("✓ Booked")
+                else:
+                    if st.button("Book", key=f"{key_prefix}_{flight['id']}"):
+                        try:
+                            book_response = user_session().post(
+                                API_URL + EP.BOOK_FLIGHT.format(trip_id=trip_id, flight_id=flight["id"])
+                            )
+                            if book_response.status_code == 200:
+                                book_data = _json(book_response)
+                                api_get.clear()
+                                st.success("Marked as booked!")
+                                st.markdown(f"[Book on airline site]({book_data['booking_url']})")
+                                st.rerun()
+                        except:
+                            pass
+            
+            st.divider()
+
 def show_flights():
     if not st.session_state.user:
         st.session_state.current_page = "login"
@@ -825,101 +1215,28 @@ def show_flights():
     st.title("✈️ Flights")
     
     try:
-        response = requests.get(
-            f"{API_URL}/trips/{trip_id}/flights",
-            params={"user_id": st.session_state.user["id"]}
-        )
+        bundle = trip_bundle(trip_id)
+        flights = bundle["flights"] if bundle else None
         
-        if response.status_code == 200:
-            flights = response.json()
+        if flights is not None:
             
             if not flights:
                 st.info("No flights found. Start planning to generate flight options.")
                 return
             
-            # Group by type
-            outbound = [f for f in flights if f["flight_type"] == "outbound"]
-            return_flights = [f for f in flights if f["flight_type"] == "return"]
+            # Group by type in a single pass
+            outbound, return_flights = [], []
+            for f in flights:
+                flight_type = f["flight_type"]
+                if flight_type == "outbound":
+                    outbound.append(f)
+                elif flight_type == "return":
+                    return_flights.append(f)
             
             if outbound:
-                st.header("Outbound Flights")
-                for flight in outbound:
-                    with st.container():
-                        col1, col2, col3 = st.columns([3, 5, 2])
-                        
-                        with col1:
-                            st.write(f"**{flight['airline']}**")
-                            st.write(f"{flight['flight_number']}")
-                        
-                        with col2:
-                            dep = flight["departure_datetime"][:16].replace("T", " ")
-                            arr = flight["arrival_datetime"][:16].replace("T", " ")
-                            st.write(f"{flight['from_airport']} → {flight['to_airport']}")
-                            st.write(f"🛫 {dep}")
-                            st.write(f"🛬 {arr}")
-                            st.write(f"⏱️ {flight['duration_minutes'] // 60}h {flight['duration_minutes'] % 60}m")
-                        
-                        with col3:
-                            st.write(f"**${flight['price']}**")
-                            
-                            if flight["status"] == "booked":
-                                st.success("✓ Booked")
-                            else:
-                                if st.button("Book", key=f"book_{flight['id']}"):
-                                    try:
-                                        book_response = requests.post(
-                                            f"{API_URL}/trips/{trip_id}/flights/{flight['id']}/book",
-                                            params={"user_id": st.session_state.user["id"]}
-                                        )
-                                        if book_response.status_code == 200:
-                                            book_data = book_response.json()
-                                            st.success("Marked as booked!")
-                                            st.markdown(f"[Book on airline site]({book_data['booking_url']})")
-                                            st.rerun()
-                                    except:
-                                        pass
-                        
-                        st.divider()
-            
+                render_flight_list("Outbound Flights", outbound, trip_id, "book")
             if return_flights:
-                st.header("Return Flights")
-                for flight in return_flights:
-                    with st.container():
-                        col1, col2, col3 = st.columns([3, 5, 2])
-                        
-                        with col1:
-                            st.write(f"**{flight['airline']}**")
-                            st.write(f"{flight['flight_number']}")
-                        
-                        with col2:
-                            dep = flight["departure_datetime"][:16].replace("T", " ")
-                            arr = flight["arrival_datetime"][:16].replace("T", " ")
-                            st.write(f"{flight['from_airport']} → {flight['to_airport']}")
-                            st.write(f"🛫 {dep}")
-                            st.write(f"🛬 {arr}")
-                            st.write(f"⏱️ {flight['duration_minutes'] // 60}h {flight['duration_minutes'] % 60}m")
-                        
-                        with col3:
-                            st.write(f"**${flight['price']}**")
-                            
-                            if flight["status"] == "booked":
-                                st.success("✓ Booked")
-                            else:
-                                if st.button("Book", key=f"book_ret_{flight['id']}"):
-                                    try:
-                                        book_response = requests.post(
-                                            f"{API_URL}/trips/{trip_id}/flights/{flight['id']}/book",
-                                            params={"user_id": st.session_state.user["id"]}
-                                        )
-                                        if book_response.status_code == 200:
-                                            book_data = book_response.json()
-                                            st.success("Marked as booked!")
-                                            st.markdown(f"[Book on airline site]({book_data['booking_url']})")
-                                            st.rerun()
-                                    except:
-                                        pass
-                        
-                        st.divider()
+                render_flight_list("Return Flights", return_flights, trip_id, "book_ret")
         else:
             st.error("Failed to load flights")
     except Exception as e:
@@ -939,13 +1256,10 @@ def show_accommodations():
     st.title("🏨 Accommodations")
     
     try:
-        response = requests.get(
-            f"{API_URL}/trips/{trip_id}/accommodations",
-            params={"user_id": st.session_state.user["id"]}
-        )
+        bundle = trip_bundle(trip_id)
+        accs = bundle["accommodations"] if bundle else None
         
-        if response.status_code == 200:
-            accs = response.json()
+        if accs is not None:
             
             if not accs:
                 st.info("No accommodations found. Start planning to generate options.")
@@ -977,12 +1291,12 @@ def show_accommodations():
                         else:
                             if st.button("Book", key=f"book_acc_{acc['id']}"):
                                 try:
-                                    book_response = requests.post(
-                                        f"{API_URL}/trips/{trip_id}/accommodations/{acc['id']}/book",
-                                        params={"user_id": st.session_state.user["id"]}
+                                    book_response = user_session().post(
+                                        API_URL + EP.BOOK_ACCOMMODATION.format(trip_id=trip_id, acc_id=acc["id"])
                                     )
                                     if book_response.status_code == 200:
-                                        book_data = book_response.json()
+                                        book_data = _json(book_response)
+                                        api_get.clear()
                                         st.success("Marked as booked!")
                                         st.markdown(f"[Book on site]({book_data['booking_url']})")
                                         st.rerun()
@@ -995,5 +1309,17 @@ def show_accommodations():
     except Exception as e:
         st.error(f"Error: {str(e)}")
 
+# Page name -> render function, used by main()
+PAGES = {
+    "login": show_login,
+    "register": show_register,
+    "dashboard": show_dashboard,
+    "create_trip": show_create_trip,
+    "planning": show_planning,
+    "itinerary": show_itinerary,
+    "flights": show_flights,
+    "accommodations": show_accommodations,
+}
+
 if __name__ == "__main__":
     main()
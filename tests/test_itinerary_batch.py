@@ -0,0 +1,106 @@
+"""
+Tests for POST /trips/{trip_id}/itinerary/batch in main.py
+
+main.py creates ./trip_planner.db on import and get_db() opens it relative to
+the working directory, so the module runs from a temporary directory with a
+fresh database.
+"""
+import pytest
+from unittest.mock import patch
+
+
+@pytest.fixture(scope="module")
+def api(tmp_path_factory):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("db"))
+        import main
+        import database
+        from fastapi.testclient import TestClient
+
+        yield main, database, TestClient(main.app)
+
+
+@pytest.fixture
+def trip(api):
+    """A user with one trip holding three planned items on day 1."""
+    _, database, _ = api
+    db = database.get_db()
+    user = database.User(email=f"{database.generate_id()}@example.com", name="T", password_hash="x")
+    db.add(user)
+    db.flush()
+    trip = database.Trip(user_id=user.id, title="Trip", destination="Paris",
+                         start_date="2026-06-01", end_date="2026-06-03")
+    db.add(trip)
+    db.flush()
+    items = [
+        database.ItineraryItem(trip_id=trip.id, day_number=1, title=f"Item {i}",
+                               start_time=f"0{i}:00", status="planned")
+        for i in range(3)
+    ]
+    db.add_all(items)
+    db.commit()
+    ids = {"user_id": user.id, "trip_id": trip.id, "item_ids": [i.id for i in items]}
+    db.close()
+    return ids
+
+
+def _statuses(database, item_ids):
+    db = database.get_db()
+    rows = db.query(database.ItineraryItem).filter(database.ItineraryItem.id.in_(item_ids))
+    result = {r.id: (r.status, r.delayed_to_day) for r in rows}
+    db.close()
+    return result
+
+
+def _post(client, trip, mutations):
+    return client.post(
+        f"/trips/{trip['trip_id']}/itinerary/batch",
+        params={"user_id": trip["user_id"]},
+        json=mutations,
+    )
+
+
+class TestApplyItineraryMutations:
+    def test_mixed_batch_applied_in_one_commit(self, api, trip):
+        main, database, client = api
+        a, b, c = trip["item_ids"]
+        session = database.get_db()
+        try:
+            with patch("main.get_db", return_value=session), \
+                 patch.object(session, "commit", wraps=session.commit) as commit:
+                response = _post(client, trip, [
+                    {"item_id": a, "action": "complete"},
+                    {"item_id": b, "action": "delay", "new_day": 2},
+                ])
+        finally:
+            session.close()
+        assert response.status_code == 200
+        assert response.json()["updated"] == 2
+        commit.assert_called_once()
+        assert _statuses(database, trip["item_ids"]) == {
+            a: ("completed", None),
+            b: ("delayed", 2),
+            c: ("planned", None),
+        }
+
+    def test_unknown_item_rejects_whole_batch(self, api, trip):
+        _, database, client = api
+        a, b, _ = trip["item_ids"]
+        response = _post(client, trip, [
+            {"item_id": a, "action": "complete"},
+            {"item_id": "missing", "action": "complete"},
+            {"item_id": b, "action": "delay", "new_day": 3},
+        ])
+        assert response.status_code == 404
+        assert "missing" in response.json()["detail"]
+        assert all(s == ("planned", None) for s in _statuses(database, trip["item_ids"]).values())
+
+    @pytest.mark.parametrize("mutation", [
+        {"action": "skip"},
+        {"action": "delay"},
+    ])
+    def test_invalid_mutation_is_422(self, api, trip, mutation):
+        _, database, client = api
+        response = _post(client, trip, [{"item_id": trip["item_ids"][0], **mutation}])
+        assert response.status_code == 422
+        assert all(s == ("planned", None) for s in _statuses(database, trip["item_ids"]).values())
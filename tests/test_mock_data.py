@@ -0,0 +1,130 @@
+"""
+Unit tests for mock_data.py
+
+The generators are seeded through seed_mock() so assertions on the random
+output are deterministic.
+"""
+import pytest
+from unittest.mock import patch
+
+import mock_data as md
+
+
+class TestSeedMock:
+    """seed_mock() should make the generators reproducible."""
+
+    def test_same_seed_same_flights(self):
+        md.seed_mock(42)
+        first = md.generate_mock_flights("Paris", "London", "2026-06-01", "2026-06-08")
+        md.seed_mock(42)
+        second = md.generate_mock_flights("Paris", "London", "2026-06-01", "2026-06-08")
+        assert first == second
+
+    def test_same_seed_same_accommodations(self):
+        md.seed_mock(7)
+        first = md.generate_mock_accommodations("Tokyo", "2026-06-01", "2026-06-04")
+        md.seed_mock(7)
+        second = md.generate_mock_accommodations("Tokyo", "2026-06-01", "2026-06-04")
+        assert first == second
+
+
+class TestGenerateMockFlights:
+    def test_outbound_only_without_return_date(self):
+        md.seed_mock(1)
+        flights = md.generate_mock_flights("Paris", "London", "2026-06-01")
+        assert 3 <= len(flights) <= 5
+        assert {f["flight_type"] for f in flights} == {"outbound"}
+
+    def test_return_leg_swaps_airports(self):
+        md.seed_mock(2)
+        flights = md.generate_mock_flights("Paris", "London", "2026-06-01", "2026-06-08")
+        ret = [f for f in flights if f["flight_type"] == "return"]
+        assert ret
+        assert all(f["from_airport"] == "LHR" and f["to_airport"] == "CDG" for f in ret)
+        assert all(f["departure_datetime"].startswith("2026-06-08T") for f in ret)
+
+    def test_fields_are_consistent(self):
+        md.seed_mock(3)
+        for f in md.generate_mock_flights("Tokyo", "Rome", "2026-06-01", "2026-06-08"):
+            assert f["flight_number"][:2] in md.AIRLINES
+            assert f["airline"] == md.AIRLINES[f["flight_number"][:2]]
+            assert f["booking_url"].endswith(f"/book/{f['flight_number']}")
+            assert 60 <= f["duration_minutes"] <= 14 * 60 + 59
+            assert f["departure_datetime"] < f["arrival_datetime"]
+
+
+class TestGenerateMockAccommodations:
+    def test_total_price_uses_nights(self):
+        md.seed_mock(4)
+        for acc in md.generate_mock_accommodations("Paris", "2026-06-01", "2026-06-05"):
+            assert acc["total_price"] == acc["price_per_night"] * 4
+
+    def test_same_day_stay_counts_one_night(self):
+        md.seed_mock(5)
+        for acc in md.generate_mock_accommodations("Paris", "2026-06-01", "2026-06-01"):
+            assert acc["total_price"] == acc["price_per_night"]
+
+    def test_unknown_city_uses_default_hotels(self):
+        accs = md.generate_mock_accommodations("Atlantis", "2026-06-01", "2026-06-03")
+        assert [a["name"] for a in accs] == [h[0] for h in md.DEFAULT_HOTELS]
+        assert all(a["city"] == "Atlantis" for a in accs)
+
+    def test_hostel_type_below_three_stars(self):
+        accs = md.generate_mock_accommodations("Paris", "2026-06-01", "2026-06-03")
+        by_name = {a["name"]: a for a in accs}
+        assert by_name["St Christopher's Inn"]["type"] == "hostel"
+        assert by_name["Le Meurice"]["type"] == "hotel"
+
+
+class TestLookups:
+    @pytest.mark.parametrize("city,expected", [
+        ("Paris", "CDG"),
+        ("new york city", "JFK"),
+        ("York", "JFK"),
+        ("Atlantis", "XXX"),
+    ])
+    def test_get_airport_for_city(self, city, expected):
+        assert md.get_airport_for_city(city) == expected
+
+    def test_get_city_info_known_and_default(self):
+        assert md.get_city_info("Tokyo")["country"] == "Japan"
+        assert md.get_city_info("Atlantis")["country"] == "Unknown"
+
+    def test_get_city_info_returns_a_copy(self):
+        md.get_city_info("Tokyo")["extra"] = 1
+        md.get_city_info("Atlantis")["country"] = "Changed"
+        assert "extra" not in md.get_city_info("Tokyo")
+        assert md.get_city_info("Atlantis")["country"] == "Unknown"
+
+    def test_get_city_field(self):
+        assert md.get_city_field("Paris", "local_transport") == "Metro, RER, Bus"
+
+
+class TestGenerateMockFlightsBatch:
+    def test_one_result_per_request(self):
+        md.seed_mock(6)
+        results = md.generate_mock_flights_batch([
+            {"from_city": "Paris", "to_city": "London", "departure_date": "2026-06-01"},
+            {"from_city": "Tokyo", "to_city": "Sydney", "departure_date": "2026-06-01",
+             "return_date": "2026-06-10"},
+        ])
+        assert len(results) == 2
+        assert {f["to_airport"] for f in results[0]} == {"LHR"}
+        assert {f["flight_type"] for f in results[1]} == {"outbound", "return"}
+
+    def test_single_random_draw_for_whole_batch(self):
+        md.seed_mock(8)
+        with patch("mock_data._flight_numerics", wraps=md._flight_numerics) as numerics:
+            results = md.generate_mock_flights_batch([
+                {"from_city": "Paris", "to_city": "London", "departure_date": "2026-06-01",
+                 "return_date": "2026-06-05"},
+                {"from_city": "Rome", "to_city": "Tokyo", "departure_date": "2026-06-02"},
+            ])
+        numerics.assert_called_once()
+        assert sum(len(r) for r in results) == len(numerics.call_args.args[0])
+        for flights in results:
+            out = [f for f in flights if f["flight_type"] == "outbound"]
+            assert 3 <= len(out) <= 5
+            assert [f["id"] for f in out] == [f"flight_out_{i}" for i in range(len(out))]
+        assert all(f["departure_datetime"].startswith("2026-06-05T")
+                   for f in results[0] if f["flight_type"] == "return")